@@ -8,11 +8,20 @@ import logging
 from abc import ABC
 from typing import TYPE_CHECKING, Any
 
+import albumentations as A  # noqa: N812
+from albumentations.pytorch import ToTensorV2
 from lightning.pytorch import LightningDataModule
 from lightning.pytorch.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
 from torch.utils.data.dataloader import DataLoader, default_collate
 
-from anomalib.data.utils import TestSplitMode, ValSplitMode, random_split, split_by_label
+from anomalib.data.utils import (
+    DeferredNormalize,
+    InputNormalizationMethod,
+    TestSplitMode,
+    ValSplitMode,
+    random_split,
+    split_by_label,
+)
 from anomalib.data.utils.synthetic import SyntheticAnomalyDataset
 
 if TYPE_CHECKING:
@@ -63,6 +72,9 @@ class AnomalibDataModule(LightningDataModule, ABC):
             Defaults to ``None``.
         seed (int | None, optional): Seed used during random subset splitting.
             Defaults to ``None``.
+        pin_memory (bool, optional): Collate the batches of the train, val and test dataloaders into pinned memory.
+            Pinned batches are copied to the GPU asynchronously, overlapping the transfer with compute.
+            Defaults to ``False``.
     """
 
     def __init__(
@@ -75,6 +87,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
         test_split_mode: TestSplitMode | str | None = None,
         test_split_ratio: float | None = None,
         seed: int | None = None,
+        pin_memory: bool = False,
     ) -> None:
         super().__init__()
         self.train_batch_size = train_batch_size
@@ -85,6 +98,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
         self.val_split_mode = ValSplitMode(val_split_mode)
         self.val_split_ratio = val_split_ratio
         self.seed = seed
+        self.pin_memory = pin_memory
 
         self.train_data: AnomalibDataset
         self.val_data: AnomalibDataset
@@ -92,6 +106,9 @@ class AnomalibDataModule(LightningDataModule, ABC):
 
         self._samples: DataFrame | None = None
 
+        # set by ``configure_deferred_normalize`` when the default transforms leave the normalization to the batches.
+        self.deferred_normalize: DeferredNormalize | None = None
+
     def setup(self, stage: str | None = None) -> None:
         """Set up train, validation and test data.
 
@@ -181,6 +198,64 @@ class AnomalibDataModule(LightningDataModule, ABC):
 
         return _is_setup
 
+    @property
+    def export_transform(self) -> A.Compose:
+        """Transforms to export along with the model, applying the same preprocessing as the test dataloader.
+
+        When the normalization is deferred to the batches, it is inserted back before the tensor conversion of the
+        test transforms, as the exported transforms are the only preprocessing applied by the inferencers.
+        """
+        transform = self.test_data.transform
+        if self.deferred_normalize is None:
+            return transform
+
+        transforms = list(transform.transforms)
+        index = next((index for index, step in enumerate(transforms) if isinstance(step, ToTensorV2)), len(transforms))
+        transforms.insert(index, self.deferred_normalize.to_albumentations())
+        return A.Compose(transforms, additional_targets=transform.additional_targets)
+
+    def configure_deferred_normalize(
+        self,
+        normalization: InputNormalizationMethod | str,
+        defer_normalize: bool,
+        transform_configs: tuple[Any, ...] = (),
+    ) -> None:
+        """Set up the normalization applied to the batches when the default transforms defer it.
+
+        Args:
+            normalization (InputNormalizationMethod | str): Normalization method passed to ``get_transforms``.
+            defer_normalize (bool): Whether ``get_transforms`` is called with ``defer_normalize=True``.
+            transform_configs (tuple[Any, ...], optional): Transform configs passed to ``get_transforms``.
+                Defaults to ``()``.
+
+        Raises:
+            ValueError: When the normalization is deferred while custom transforms are used.
+        """
+        normalization = InputNormalizationMethod(normalization)
+        if not defer_normalize:
+            self.deferred_normalize = None
+            return
+        if any(config is not None for config in transform_configs):
+            msg = "Normalization can only be deferred when the default transforms are used."
+            raise ValueError(msg)
+        self.deferred_normalize = DeferredNormalize.from_normalization_method(normalization)
+
+    def on_after_batch_transfer(self, batch: Any, dataloader_idx: int) -> Any:  # noqa: ANN401, ARG002
+        """Apply the deferred normalization once the batch has been moved to the accelerator.
+
+        Args:
+            batch (Any): Batch returned by the dataloader.
+            dataloader_idx (int): Index of the dataloader the batch belongs to.
+
+        Returns:
+            Any: Batch with normalized images.
+        """
+        if self.deferred_normalize is not None and isinstance(batch, dict):
+            for key in ("image", "depth_image"):
+                if key in batch:
+                    batch[key] = self.deferred_normalize.to(batch[key].device)(batch[key])
+        return batch
+
     def train_dataloader(self) -> TRAIN_DATALOADERS:
         """Get train dataloader."""
         return DataLoader(
@@ -188,6 +263,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
             shuffle=True,
             batch_size=self.train_batch_size,
             num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
         )
 
     def val_dataloader(self) -> EVAL_DATALOADERS:
@@ -197,6 +273,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
             shuffle=False,
             batch_size=self.eval_batch_size,
             num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
             collate_fn=collate_fn,
         )
 
@@ -207,6 +284,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
             shuffle=False,
             batch_size=self.eval_batch_size,
             num_workers=self.num_workers,
+            pin_memory=self.pin_memory,
             collate_fn=collate_fn,
         )
 
@@ -219,6 +219,12 @@ class BTech(AnomalibDataModule):
             Defaults to ``0.5``.
         seed (int | None, optional): Seed which may be set to a fixed value for reproducibility.
             Defaults to ``None``.
+        defer_normalize (bool, optional): Leave the normalization of the default transforms to the batches on
+            the accelerator. See ``get_transforms``.
+            Defaults to ``False``.
+        pin_memory (bool, optional): Collate the batches into pinned memory, so that they are copied to the GPU
+            asynchronously.
+            Defaults to ``False``.
 
     Examples:
         To create the BTech datamodule, we need to instantiate the class, and call the ``setup`` method.
@@ -279,6 +285,8 @@ class BTech(AnomalibDataModule):
         val_split_mode: ValSplitMode | str = ValSplitMode.SAME_AS_TEST,
         val_split_ratio: float = 0.5,
         seed: int | None = None,
+        defer_normalize: bool = False,
+        pin_memory: bool = False,
     ) -> None:
         super().__init__(
             train_batch_size=train_batch_size,
@@ -289,23 +297,32 @@ class BTech(AnomalibDataModule):
             val_split_mode=val_split_mode,
             val_split_ratio=val_split_ratio,
             seed=seed,
+            pin_memory=pin_memory,
         )
 
         self.root = Path(root)
         self.category = Path(category)
         task = TaskType(task)
 
+        self.configure_deferred_normalize(
+            normalization,
+            defer_normalize=defer_normalize,
+            transform_configs=(transform_config_train, transform_config_eval),
+        )
+
         transform_train = get_transforms(
             config=transform_config_train,
             image_size=image_size,
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
+            defer_normalize=defer_normalize,
         )
         transform_eval = get_transforms(
             config=transform_config_eval,
             image_size=image_size,
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
+            defer_normalize=defer_normalize,
         )
 
         self.train_data = BTechDataset(
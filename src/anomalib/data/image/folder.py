@@ -316,6 +316,12 @@ class Folder(AnomalibDataModule):
             Defaults to ``0.5``.
         seed (int | None, optional): Seed used during random subset splitting.
             Defaults to ``None``.
+        defer_normalize (bool, optional): Leave the normalization of the default transforms to the batches on
+            the accelerator. See ``get_transforms``.
+            Defaults to ``False``.
+        pin_memory (bool, optional): Collate the batches into pinned memory, so that they are copied to the GPU
+            asynchronously.
+            Defaults to ``False``.
 
     Examples:
         The following code demonstrates how to use the ``Folder`` datamodule. Assume that the dataset is structured
@@ -396,6 +402,8 @@ class Folder(AnomalibDataModule):
         val_split_mode: ValSplitMode | str = ValSplitMode.FROM_TEST,
         val_split_ratio: float = 0.5,
         seed: int | None = None,
+        defer_normalize: bool = False,
+        pin_memory: bool = False,
     ) -> None:
         task = TaskType(task)
         test_split_mode = TestSplitMode(test_split_mode)
@@ -409,6 +417,7 @@ class Folder(AnomalibDataModule):
             val_split_mode=val_split_mode,
             val_split_ratio=val_split_ratio,
             seed=seed,
+            pin_memory=pin_memory,
         )
 
         if task == TaskType.SEGMENTATION and test_split_mode == TestSplitMode.FROM_DIR and mask_dir is None:
@@ -421,17 +430,25 @@ class Folder(AnomalibDataModule):
             )
 
         self.normal_split_ratio = normal_split_ratio
+        self.configure_deferred_normalize(
+            normalization,
+            defer_normalize=defer_normalize,
+            transform_configs=(transform_config_train, transform_config_eval),
+        )
+
         transform_train = get_transforms(
             config=transform_config_train,
             image_size=image_size,
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
+            defer_normalize=defer_normalize,
         )
         transform_eval = get_transforms(
             config=transform_config_eval,
             image_size=image_size,
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
+            defer_normalize=defer_normalize,
         )
 
         self.train_data = FolderDataset(
@@ -245,6 +245,12 @@ class Kolektor(AnomalibDataModule):
             Defaults to ``0.5``
         seed (int | None, optional): Seed which may be set to a fixed value for reproducibility.
             Defaults to ``None``.
+        defer_normalize (bool, optional): Leave the normalization of the default transforms to the batches on
+            the accelerator. See ``get_transforms``.
+            Defaults to ``False``.
+        pin_memory (bool, optional): Collate the batches into pinned memory, so that they are copied to the GPU
+            asynchronously.
+            Defaults to ``False``.
     """
 
     def __init__(
@@ -264,6 +270,8 @@ class Kolektor(AnomalibDataModule):
         val_split_mode: ValSplitMode | str = ValSplitMode.SAME_AS_TEST,
         val_split_ratio: float = 0.5,
         seed: int | None = None,
+        defer_normalize: bool = False,
+        pin_memory: bool = False,
     ) -> None:
         super().__init__(
             train_batch_size=train_batch_size,
@@ -274,22 +282,31 @@ class Kolektor(AnomalibDataModule):
             val_split_mode=val_split_mode,
             val_split_ratio=val_split_ratio,
             seed=seed,
+            pin_memory=pin_memory,
         )
 
         task = TaskType(task)
         self.root = Path(root)
 
+        self.configure_deferred_normalize(
+            normalization,
+            defer_normalize=defer_normalize,
+            transform_configs=(transform_config_train, transform_config_eval),
+        )
+
         transform_train = get_transforms(
             config=transform_config_train,
             image_size=image_size,
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
+            defer_normalize=defer_normalize,
         )
         transform_eval = get_transforms(
             config=transform_config_eval,
             image_size=image_size,
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
+            defer_normalize=defer_normalize,
         )
 
         self.train_data = KolektorDataset(
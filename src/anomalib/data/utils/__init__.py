@@ -24,7 +24,16 @@ from .path import (
     validate_path,
 )
 from .split import Split, TestSplitMode, ValSplitMode, concatenate_datasets, random_split, split_by_label
-from .transforms import InputNormalizationMethod, get_transforms
+from .transforms import (
+    BatchedCompose,
+    DeferredNormalize,
+    FusedCompose,
+    InputNormalizationMethod,
+    NormalizeToTensor,
+    PrecomputedNormalize,
+    ResizeCenterCrop,
+    get_transforms,
+)
 
 __all__ = [
     "generate_output_image_filename",
@@ -47,6 +56,12 @@ __all__ = [
     "boxes_to_anomaly_maps",
     "get_transforms",
     "InputNormalizationMethod",
+    "DeferredNormalize",
+    "FusedCompose",
+    "BatchedCompose",
+    "ResizeCenterCrop",
+    "NormalizeToTensor",
+    "PrecomputedNormalize",
     "download_and_extract",
     "DownloadInfo",
     "_check_and_convert_path",
@@ -0,0 +1,124 @@
+"""Fused image kernels used by the default transforms.
+
+The kernels are compiled with Numba when it is installed, otherwise an equivalent OpenCV and NumPy implementation is
+used.
+"""
+
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Callable
+from functools import cache
+from importlib.util import find_spec
+
+import cv2
+import numpy as np
+
+_normalize_to_chw_kernel: Callable | None = None
+_lut_to_chw_kernel: Callable | None = None
+
+if find_spec("numba") is not None:
+    from numba import njit
+
+    @njit(cache=True, nogil=True)
+    def _normalize_to_chw_kernel(image: np.ndarray, mean: np.ndarray, inv_std: np.ndarray, out: np.ndarray) -> None:
+        height, width, channels = image.shape
+        # channels outermost, so that the output plane being written is contiguous
+        for c in range(channels):
+            for y in range(height):
+                for x in range(width):
+                    out[c, y, x] = (np.float32(image[y, x, c]) - mean[c]) * inv_std[c]
+
+    @njit(cache=True, nogil=True)
+    def _lut_to_chw_kernel(image: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+        height, width, channels = image.shape
+        for c in range(channels):
+            for y in range(height):
+                for x in range(width):
+                    out[c, y, x] = lut[c, image[y, x, c]]
+
+
+@cache
+def compile_kernels() -> None:
+    """Compile the Numba kernels for ``uint8`` and ``float32`` images ahead of their first call.
+
+    Numba compiles a kernel, or loads it from its on disk cache, the first time it is called in a process, which takes
+    a few hundred milliseconds. Compiling them when the transforms are created, in the main process, lets forked
+    dataloader workers inherit the compiled kernels instead of each paying that cost on their first sample. Does
+    nothing when Numba is not installed.
+    """
+    if _lut_to_chw_kernel is None or _normalize_to_chw_kernel is None:
+        return
+    mean = np.zeros(3, dtype=np.float32)
+    inv_std = np.ones(3, dtype=np.float32)
+    out = np.empty((3, 1, 1), dtype=np.float32)
+    image = np.zeros((1, 1, 3), dtype=np.uint8)
+    _lut_to_chw_kernel(image, normalization_lut(mean, inv_std), out)
+    for dtype in (np.uint8, np.float32):
+        _normalize_to_chw_kernel(image.astype(dtype), mean, inv_std, out)
+
+
+def normalization_lut(mean: np.ndarray, inv_std: np.ndarray) -> np.ndarray:
+    """Build the lookup table mapping every ``uint8`` value to its normalized value.
+
+    Args:
+        mean (np.ndarray): ``float32`` array of shape ``(C,)`` with the per channel mean.
+        inv_std (np.ndarray): ``float32`` array of shape ``(C,)`` with the per channel reciprocal standard deviation.
+
+    Returns:
+        np.ndarray: ``float32`` lookup table of shape ``(C, 256)``.
+    """
+    values = np.arange(256, dtype=np.float32)
+    return np.ascontiguousarray((values[None, :] - mean[:, None]) * inv_std[:, None], dtype=np.float32)
+
+
+def normalize_to_chw(
+    image: np.ndarray,
+    mean: np.ndarray,
+    inv_std: np.ndarray,
+    out: np.ndarray | None = None,
+    lut: np.ndarray | None = None,
+) -> np.ndarray:
+    """Normalize an ``HWC`` image and transpose it to ``CHW`` in a single pass.
+
+    Computes ``(image - mean) * inv_std`` in ``float32``, which is what ``A.Normalize`` computes when ``mean`` and
+    ``inv_std`` are already scaled by the maximum pixel value. ``uint8`` images only have 256 possible values per
+    channel, so when ``lut`` is given they are normalized with a table lookup instead.
+
+    Args:
+        image (np.ndarray): Image of shape ``(H, W, C)``.
+        mean (np.ndarray): ``float32`` array of shape ``(C,)`` with the per channel mean.
+        inv_std (np.ndarray): ``float32`` array of shape ``(C,)`` with the per channel reciprocal standard deviation.
+        out (np.ndarray | None, optional): Contiguous ``float32`` array of shape ``(C, H, W)`` to write into.
+            Allocated when ``None``.
+            Defaults to ``None``.
+        lut (np.ndarray | None, optional): Lookup table built by ``normalization_lut`` for ``uint8`` images.
+            Defaults to ``None``.
+
+    Returns:
+        np.ndarray: Normalized ``float32`` image of shape ``(C, H, W)``.
+
+    Examples:
+        >>> image = np.full((4, 4, 3), 255, dtype=np.uint8)
+        >>> mean = np.zeros(3, dtype=np.float32)
+        >>> inv_std = np.full(3, 1 / 255, dtype=np.float32)
+        >>> normalize_to_chw(image, mean, inv_std).shape
+        (3, 4, 4)
+    """
+    height, width, channels = image.shape
+    output = np.empty((channels, height, width), dtype=np.float32) if out is None else out
+
+    if lut is not None and image.dtype == np.uint8:
+        if _lut_to_chw_kernel is not None:
+            _lut_to_chw_kernel(np.ascontiguousarray(image), lut, output)
+        else:
+            # split into contiguous planes and look each one up straight into its output plane
+            for channel, plane in enumerate(cv2.split(np.ascontiguousarray(image))):
+                cv2.LUT(plane, lut[channel], dst=output[channel])
+    elif _normalize_to_chw_kernel is not None:
+        _normalize_to_chw_kernel(np.ascontiguousarray(image), mean, inv_std, output)
+    else:
+        np.copyto(output, np.moveaxis(image, -1, 0), casting="unsafe")
+        output -= mean[:, None, None]
+        output *= inv_std[:, None, None]
+    return output
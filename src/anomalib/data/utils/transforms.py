@@ -5,12 +5,22 @@
 
 
 import logging
+from collections.abc import Callable, Sequence
 from enum import Enum
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any
 
 import albumentations as A  # noqa: N812
+import cv2
+import numpy as np
+import torch
+from albumentations.augmentations.geometric import functional as F  # noqa: N812
 from albumentations.pytorch import ToTensorV2
-from omegaconf import DictConfig
+from omegaconf import DictConfig, OmegaConf
+from torch import nn
 
+from anomalib.data.utils.fused import compile_kernels, normalization_lut, normalize_to_chw
 from anomalib.data.utils.image import get_image_height_and_width
 
 logger = logging.getLogger(__name__)
@@ -24,12 +34,587 @@ class InputNormalizationMethod(str, Enum):
     CLIP = "clip"  # normalization to CLIP statistics
 
 
+# mean and standard deviation of the normalization methods.
+_NORMALIZATION_STATS: dict[InputNormalizationMethod, tuple[tuple[float, float, float], tuple[float, float, float]]] = {
+    InputNormalizationMethod.IMAGENET: ((0.485, 0.456, 0.406), (0.229, 0.224, 0.225)),
+    InputNormalizationMethod.CLIP: ((0.48145466, 0.4578275, 0.40821073), (0.26862954, 0.26130258, 0.27577711)),
+}
+
+
+class NormalizeToTensor(ToTensorV2):
+    """Normalize the image and convert it to a ``CHW`` torch tensor in a single pass.
+
+    Equivalent to ``A.Normalize`` followed by ``ToTensorV2``, but the subtraction, scaling and ``HWC`` to ``CHW``
+    transpose are fused into one kernel, so the image is streamed through memory once and the returned tensor is
+    contiguous. ``uint8`` images are normalized with a lookup table built once at construction. Masks are converted to
+    tensors as done by ``ToTensorV2``.
+
+    Args:
+        mean (tuple[float, ...]): Mean values for each channel.
+        std (tuple[float, ...]): Standard deviation values for each channel.
+        max_pixel_value (float, optional): Maximum possible pixel value.
+            Defaults to ``255.0``.
+        transpose_mask (bool, optional): If ``True``, transpose 3D masks from ``HWC`` to ``CHW``.
+            Defaults to ``False``.
+        always_apply (bool, optional): Apply the transform regardless of ``p``.
+            Defaults to ``True``.
+        p (float, optional): Probability of applying the transform.
+            Defaults to ``1.0``.
+
+    Examples:
+        >>> transform = NormalizeToTensor(mean=(0.485, 0.456, 0.406), std=(0.229, 0.224, 0.225))
+        >>> transform(image=np.zeros((256, 256, 3), dtype=np.uint8))["image"].shape
+        torch.Size([3, 256, 256])
+    """
+
+    def __init__(
+        self,
+        mean: tuple[float, ...],
+        std: tuple[float, ...],
+        max_pixel_value: float = 255.0,
+        transpose_mask: bool = False,
+        always_apply: bool = True,
+        p: float = 1.0,
+    ) -> None:
+        super().__init__(transpose_mask=transpose_mask, always_apply=always_apply, p=p)
+        self.mean = mean
+        self.std = std
+        self.max_pixel_value = max_pixel_value
+        self._mean = np.array(mean, dtype=np.float32) * np.float32(max_pixel_value)
+        self._inv_std = np.reciprocal(np.array(std, dtype=np.float32) * np.float32(max_pixel_value))
+        self._lut = normalization_lut(self._mean, self._inv_std)
+        compile_kernels()
+
+    def apply(self, img: np.ndarray, **params: Any) -> torch.Tensor:  # noqa: ANN401, ARG002
+        """Normalize the image and convert it to a ``CHW`` tensor."""
+        if img.ndim != 3 or img.shape[-1] != len(self._mean):
+            # unexpected layouts are broadcast (or rejected) the same way ``A.Normalize`` does.
+            return super().apply((img.astype(np.float32) - self._mean) * self._inv_std)
+        return torch.from_numpy(self.normalize(img))
+
+    def normalize(self, img: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Normalize an ``HWC`` image into a ``CHW`` array.
+
+        Args:
+            img (np.ndarray): Image of shape ``(H, W, C)``.
+            out (np.ndarray | None, optional): Contiguous ``float32`` array of shape ``(C, H, W)`` to write into.
+                Defaults to ``None``.
+
+        Returns:
+            np.ndarray: Normalized ``float32`` image of shape ``(C, H, W)``.
+        """
+        return normalize_to_chw(img, self._mean, self._inv_std, out=out, lut=self._lut)
+
+    def get_transform_init_args_names(self) -> tuple[str, ...]:
+        """Return the names of the arguments used to serialize the transform."""
+        return ("mean", "std", "max_pixel_value", "transpose_mask")
+
+    def to_dict_private(self) -> dict[str, Any]:
+        """Serialize the transform as the equivalent ``A.Normalize`` and ``ToTensorV2`` steps.
+
+        Exported transforms are then deserialized with plain albumentations, without importing anomalib.
+        """
+        return A.Sequential(
+            [
+                A.Normalize(mean=self.mean, std=self.std, max_pixel_value=self.max_pixel_value, always_apply=True),
+                ToTensorV2(transpose_mask=self.transpose_mask),
+            ],
+            p=1.0,
+        ).to_dict_private()
+
+
+class PrecomputedNormalize(A.Normalize):
+    """``A.Normalize`` with the normalization constants computed once at construction.
+
+    ``A.Normalize`` converts ``mean`` and ``std`` to arrays, scales them and takes the reciprocal on every call. Here
+    they are stored as ``float32`` arrays when the transform is created, and ``uint8`` images are normalized with
+    ``cv2.LUT`` from a lookup table of the 256 possible values of each channel, which needs neither the ``float32``
+    copy of the image nor the subtraction and multiplication. Float images are normalized by ``cv2.subtract`` and
+    ``cv2.multiply`` into a single ``float32`` output.
+
+    Args:
+        mean (float | tuple[float, ...]): Mean values for each channel.
+        std (float | tuple[float, ...]): Standard deviation values for each channel.
+        max_pixel_value (float, optional): Maximum possible pixel value.
+            Defaults to ``255.0``.
+        always_apply (bool, optional): Apply the transform regardless of ``p``.
+            Defaults to ``False``.
+        p (float, optional): Probability of applying the transform.
+            Defaults to ``1.0``.
+
+    Examples:
+        >>> transform = PrecomputedNormalize(mean=(0.485, 0.456, 0.406), std=(0.229, 0.224, 0.225))
+        >>> transform(image=np.zeros((256, 256, 3), dtype=np.uint8))["image"].dtype
+        dtype('float32')
+    """
+
+    def __init__(
+        self,
+        mean: float | tuple[float, ...],
+        std: float | tuple[float, ...],
+        max_pixel_value: float = 255.0,
+        always_apply: bool = False,
+        p: float = 1.0,
+    ) -> None:
+        super().__init__(mean=mean, std=std, max_pixel_value=max_pixel_value, always_apply=always_apply, p=p)
+        self._mean = np.array(mean, dtype=np.float32).reshape(-1) * np.float32(max_pixel_value)
+        self._inv_std = np.reciprocal(np.array(std, dtype=np.float32).reshape(-1) * np.float32(max_pixel_value))
+        # ``cv2.LUT`` expects one table of 256 entries per channel, laid out as a ``(256, 1, C)`` image.
+        self._lut = np.ascontiguousarray(normalization_lut(self._mean, self._inv_std).T[:, None, :])
+        # ``cv2.subtract`` and ``cv2.multiply`` take the per channel constants of float images as 4 element scalars.
+        padding = max(4 - len(self._mean), 0)
+        self._mean_scalar = np.pad(self._mean.astype(np.float64), (0, padding))
+        self._inv_std_scalar = np.pad(self._inv_std.astype(np.float64), (0, padding), constant_values=1.0)
+
+    def apply(self, img: np.ndarray, **params: Any) -> np.ndarray:  # noqa: ANN401
+        """Normalize the image."""
+        if img.ndim != 3 or img.shape[-1] != len(self._mean):
+            # unexpected layouts are broadcast (or rejected) the same way ``A.Normalize`` does.
+            return super().apply(img, **params)
+        if img.dtype == np.uint8:
+            output = cv2.LUT(img, self._lut)
+        elif len(self._mean) <= 4:
+            output = cv2.subtract(img, self._mean_scalar, dtype=cv2.CV_32F)
+            cv2.multiply(output, self._inv_std_scalar, dst=output)
+        else:
+            return super().apply(img, **params)
+        # opencv drops the channel dimension of single channel images
+        return output[..., None] if output.ndim == 2 else output
+
+    def to_dict_private(self) -> dict[str, Any]:
+        """Serialize the transform as the equivalent ``A.Normalize``."""
+        return {**super().to_dict_private(), "__class_fullname__": A.Normalize.get_class_fullname()}
+
+
+class ResizeCenterCrop(A.DualTransform):
+    """Resize the input and crop its center in a single step.
+
+    Equivalent to ``A.Resize`` followed by ``A.CenterCrop``, but images are warped directly from the source
+    resolution to the cropped region, so only the pixels that are kept are interpolated and the resized image is
+    never allocated. Masks are resized with nearest neighbour interpolation and cropped, as done by ``A.Resize`` and
+    ``A.CenterCrop``.
+
+    ``cv2.warpAffine`` snaps the sample positions to a 1/32 pixel grid where ``cv2.resize`` does not, so bilinear
+    images may differ from ``A.Resize`` followed by ``A.CenterCrop`` by a few intensity levels around sharp edges.
+    Masks are identical. ``cv2.warpAffine`` is also slower per output pixel than ``cv2.resize``, so this is only
+    faster when a small crop is taken from an upscaled image, and is not used by the default transforms.
+
+    Args:
+        height (int): Height of the resized image.
+        width (int): Width of the resized image.
+        crop_height (int): Height of the crop.
+        crop_width (int): Width of the crop.
+        interpolation (int, optional): OpenCV interpolation flag used for images.
+            Defaults to ``cv2.INTER_LINEAR``.
+        always_apply (bool, optional): Apply the transform regardless of ``p``.
+            Defaults to ``False``.
+        p (float, optional): Probability of applying the transform.
+            Defaults to ``1.0``.
+
+    Examples:
+        >>> transform = ResizeCenterCrop(height=256, width=256, crop_height=224, crop_width=224)
+        >>> transform(image=np.zeros((512, 512, 3), dtype=np.uint8))["image"].shape
+        (224, 224, 3)
+    """
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        crop_height: int,
+        crop_width: int,
+        interpolation: int = cv2.INTER_LINEAR,
+        always_apply: bool = False,
+        p: float = 1.0,
+    ) -> None:
+        super().__init__(always_apply=always_apply, p=p)
+        if crop_height > height or crop_width > width:
+            msg = (
+                "Crop size may not be larger than image size. "
+                f"Found {(height, width)} and {(crop_height, crop_width)}"
+            )
+            raise ValueError(msg)
+        self.height = height
+        self.width = width
+        self.crop_height = crop_height
+        self.crop_width = crop_width
+        self.interpolation = interpolation
+        # offset of the crop in the resized image, as computed by ``A.CenterCrop``
+        self._x_offset = (width - crop_width) // 2
+        self._y_offset = (height - crop_height) // 2
+
+    def apply(
+        self,
+        img: np.ndarray,
+        interpolation: int = cv2.INTER_LINEAR,
+        **params: Any,  # noqa: ANN401, ARG002
+    ) -> np.ndarray:
+        """Resize and crop the image."""
+        # ``warpAffine`` interpolates like ``resize`` for bilinear interpolation and up to four channels only.
+        if interpolation != cv2.INTER_LINEAR or (img.ndim == 3 and img.shape[2] > 4):
+            return self._resize_and_crop(img, interpolation)
+
+        scale_x = img.shape[1] / self.width
+        scale_y = img.shape[0] / self.height
+        # map the pixel centers of the crop to the source image, following the pixel center convention of ``resize``
+        matrix = np.array(
+            [
+                [scale_x, 0.0, (self._x_offset + 0.5) * scale_x - 0.5],
+                [0.0, scale_y, (self._y_offset + 0.5) * scale_y - 0.5],
+            ],
+        )
+        output = cv2.warpAffine(
+            img,
+            matrix,
+            (self.crop_width, self.crop_height),
+            flags=interpolation | cv2.WARP_INVERSE_MAP,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+        # opencv drops the channel dimension of single channel images
+        return output[..., None] if img.ndim == 3 and output.ndim == 2 else output
+
+    def apply_to_mask(self, img: np.ndarray, **params: Any) -> np.ndarray:  # noqa: ANN401, ARG002
+        """Resize and crop the mask."""
+        return self._resize_and_crop(img, cv2.INTER_NEAREST)
+
+    def _resize_and_crop(self, img: np.ndarray, interpolation: int) -> np.ndarray:
+        if img.shape[:2] != (self.height, self.width):
+            img = F.resize(img, self.height, self.width, interpolation=interpolation)
+        y_offset, x_offset = self._y_offset, self._x_offset
+        return img[y_offset : y_offset + self.crop_height, x_offset : x_offset + self.crop_width]
+
+    def get_params(self) -> dict[str, Any]:
+        """Return the interpolation used for images."""
+        return {"interpolation": self.interpolation}
+
+    def get_transform_init_args_names(self) -> tuple[str, ...]:
+        """Return the names of the arguments used to serialize the transform."""
+        return ("height", "width", "crop_height", "crop_width", "interpolation")
+
+    def to_dict_private(self) -> dict[str, Any]:
+        """Serialize the transform as the equivalent ``A.Resize`` and ``A.CenterCrop`` steps."""
+        return A.Sequential(
+            [
+                A.Resize(self.height, self.width, interpolation=self.interpolation, always_apply=True),
+                A.CenterCrop(self.crop_height, self.crop_width, always_apply=True),
+            ],
+            p=self.p,
+        ).to_dict_private()
+
+
+# transforms and compositions exposed by albumentations, looked up by the names used in the transforms configs.
+_ALBUMENTATIONS_TRANSFORMS: dict[str, type] = {
+    name: attribute for name, attribute in vars(A).items() if isinstance(attribute, type)
+}
+
+
+def _identity(array: np.ndarray) -> np.ndarray:
+    return array
+
+
+def _bind_fused_functions(transform: A.BasicTransform) -> tuple[Callable, Callable] | None:
+    """Bind the image and mask functions of a deterministic transform.
+
+    Args:
+        transform (A.BasicTransform): Transform to bind.
+
+    Returns:
+        tuple[Callable, Callable] | None: Functions applying the transform to an image and to a mask, or ``None`` when
+            the transform is random or is not known to be deterministic.
+    """
+    if not (transform.always_apply or transform.p >= 1):
+        return None
+
+    binder = _FUSED_FUNCTION_BINDERS.get(type(transform))
+    return None if binder is None else binder(transform)
+
+
+# binders of the image and mask functions of the deterministic transforms that can be fused, keyed by exact type.
+_FUSED_FUNCTION_BINDERS: dict[type, Callable[[Any], tuple[Callable, Callable]]] = {
+    A.Resize: lambda transform: (
+        partial(transform.apply, interpolation=transform.interpolation),
+        partial(transform.apply, interpolation=cv2.INTER_NEAREST),
+    ),
+    A.CenterCrop: lambda transform: (transform.apply, transform.apply),
+    ResizeCenterCrop: lambda transform: (
+        partial(transform.apply, interpolation=transform.interpolation),
+        transform.apply_to_mask,
+    ),
+    A.Normalize: lambda transform: (transform.apply, _identity),
+    PrecomputedNormalize: lambda transform: (transform.apply, _identity),
+    A.ToFloat: lambda transform: (transform.apply, _identity),
+    ToTensorV2: lambda transform: (transform.apply, transform.apply_to_mask),
+    NormalizeToTensor: lambda transform: (transform.apply, transform.apply_to_mask),
+}
+
+
+class FusedCompose(A.Compose):
+    """``A.Compose`` that runs deterministic pipelines without the per transform dispatch.
+
+    When every transform is always applied and is one of the deterministic operations used by the default transforms
+    (``Resize``, ``CenterCrop``, ``ResizeCenterCrop``, ``Normalize``, ``ToFloat`` and the tensor conversions), the
+    image and mask functions of the transforms are bound once at construction and chained directly on each call,
+    skipping the argument checks, parameter sampling and target dispatch ``A.Compose`` performs for every transform.
+    Other pipelines, and calls with targets other than images and masks, fall back to ``A.Compose``.
+
+    Args:
+        transforms (Sequence[A.BasicTransform]): List of transformations to compose.
+        *args: Arguments passed to ``A.Compose``.
+        **kwargs: Keyword arguments passed to ``A.Compose``.
+
+    Examples:
+        >>> transforms = FusedCompose([A.Resize(256, 256), A.ToFloat(max_value=255)])
+        >>> transforms(image=np.zeros((512, 512, 3), dtype=np.uint8))["image"].shape
+        (256, 256, 3)
+    """
+
+    def __init__(self, transforms: Sequence[A.BasicTransform], *args, **kwargs) -> None:
+        super().__init__(transforms, *args, **kwargs)
+
+        self._fused_targets = {"image": "image", "mask": "mask"}
+        self._fused_targets.update(
+            {key: target for key, target in self.additional_targets.items() if target in ("image", "mask")},
+        )
+        self._fused_functions: dict[str, list[Callable]] | None = None
+
+        functions = [_bind_fused_functions(transform) for transform in self.transforms]
+        bound_functions = [function for function in functions if function is not None]
+        if self.p >= 1 and not self.processors and len(bound_functions) == len(functions):
+            self._fused_functions = {
+                "image": [image_function for image_function, _ in bound_functions],
+                "mask": [mask_function for _, mask_function in bound_functions],
+            }
+
+    def __call__(self, *args, force_apply: bool = False, **data) -> dict[str, Any]:
+        """Apply the transforms to the passed targets."""
+        if (
+            self._fused_functions is None
+            or args
+            or not data.keys() <= self._fused_targets.keys()
+            or not all(isinstance(value, np.ndarray) for value in data.values())
+        ):
+            return super().__call__(*args, force_apply=force_apply, **data)
+
+        if self.is_check_shapes and len({value.shape[:2] for value in data.values()}) > 1:
+            msg = (
+                "Height and Width of image, mask or masks should be equal. You can disable shapes check "
+                "by setting a parameter is_check_shapes=False of Compose class (do it only if you are sure "
+                "about your data consistency)."
+            )
+            raise ValueError(msg)
+
+        result = {}
+        for key, value in data.items():
+            for function in self._fused_functions[self._fused_targets[key]]:
+                value = function(value)  # noqa: PLW2901
+            result[key] = np.ascontiguousarray(value) if isinstance(value, np.ndarray) else value
+        return result
+
+    def to_dict_private(self) -> dict[str, Any]:
+        """Serialize the transforms as the equivalent ``A.Compose``.
+
+        Exported transforms are then deserialized with plain albumentations, without importing anomalib.
+        """
+        return {**super().to_dict_private(), "__class_fullname__": A.Compose.get_class_fullname()}
+
+
+class BatchedCompose(FusedCompose):
+    """``FusedCompose`` that additionally transforms whole batches of images.
+
+    Calling it with ``images`` applies the transforms to every image of the batch and writes the results into a
+    single preallocated batch, instead of returning one output per image to be stacked by the collate function. When
+    the pipeline ends with ``NormalizeToTensor``, the images are normalized straight into the batch, which
+    ``apply_to_batch`` can also take as ``out`` to reuse a single buffer across batches. Calls with the usual targets
+    behave as ``FusedCompose``.
+
+    Args:
+        transforms (Sequence[A.BasicTransform]): List of deterministic transformations to compose.
+        *args: Arguments passed to ``A.Compose``.
+        **kwargs: Keyword arguments passed to ``A.Compose``.
+
+    Raises:
+        ValueError: When the transforms cannot be fused.
+
+    Examples:
+        >>> transforms = get_transforms(image_size=256, batched=True)
+        >>> images = np.zeros((32, 512, 512, 3), dtype=np.uint8)
+        >>> transforms(images=images)["images"].shape
+        torch.Size([32, 3, 256, 256])
+    """
+
+    def __init__(self, transforms: Sequence[A.BasicTransform], *args, **kwargs) -> None:
+        super().__init__(transforms, *args, **kwargs)
+        if self._fused_functions is None:
+            msg = "Only deterministic transforms that are always applied can be batched."
+            raise ValueError(msg)
+
+    def __call__(self, *args, force_apply: bool = False, **data) -> dict[str, Any]:
+        """Apply the transforms to the passed targets, or to the batch passed as ``images``."""
+        if "images" not in data:
+            return super().__call__(*args, force_apply=force_apply, **data)
+        if args or len(data) > 1:
+            msg = "A batch of images can not be transformed together with other targets."
+            raise ValueError(msg)
+        return {"images": self.apply_to_batch(data["images"])}
+
+    def apply_to_batch(
+        self,
+        images: np.ndarray | Sequence[np.ndarray],
+        out: torch.Tensor | None = None,
+    ) -> np.ndarray | torch.Tensor:
+        """Apply the transforms to a batch of images.
+
+        Args:
+            images (np.ndarray | Sequence[np.ndarray]): Array of shape ``(N, H, W, C)`` or sequence of ``N`` images,
+                which may have different sizes.
+            out (torch.Tensor | None, optional): Contiguous ``float32`` CPU tensor of shape ``(N, C, H, W)`` the images
+                are normalized into, so that a batch buffer can be reused across calls. Only supported when the
+                transforms end with ``NormalizeToTensor``. Allocated when ``None``.
+                Defaults to ``None``.
+
+        Raises:
+            ValueError: When the batch is empty.
+            ValueError: When ``out`` is given but cannot hold the batch.
+
+        Returns:
+            np.ndarray | torch.Tensor: Batch of transformed images, sharing its memory with ``out`` when given.
+        """
+        if len(images) == 0:
+            msg = "Cannot transform an empty batch of images."
+            raise ValueError(msg)
+
+        assert self._fused_functions is not None
+        functions = self._fused_functions["image"]
+        last_transform = self.transforms[-1] if self.transforms else None
+
+        if not isinstance(last_transform, NormalizeToTensor):
+            if out is not None:
+                msg = "Preallocated batches are only supported for transforms ending with NormalizeToTensor."
+                raise ValueError(msg)
+            outputs = [self._apply_functions(functions, image) for image in images]
+            return torch.stack(outputs) if isinstance(outputs[0], torch.Tensor) else np.stack(outputs)
+
+        batch: np.ndarray | None = None
+        for index, image in enumerate(images):
+            image = np.ascontiguousarray(self._apply_functions(functions[:-1], image))  # noqa: PLW2901
+            if batch is None:
+                height, width, channels = image.shape
+                batch = self._allocate_batch((len(images), channels, height, width), out)
+            last_transform.normalize(image, out=batch[index])
+        assert batch is not None
+        return out if out is not None else torch.from_numpy(batch)
+
+    @staticmethod
+    def _allocate_batch(shape: tuple[int, ...], out: torch.Tensor | None) -> np.ndarray:
+        if out is None:
+            return np.empty(shape, dtype=np.float32)
+        if (
+            tuple(out.shape) != shape
+            or out.dtype != torch.float32
+            or out.device.type != "cpu"
+            or not out.is_contiguous()
+        ):
+            msg = f"Expected a contiguous float32 CPU tensor of shape {shape} to transform the batch into."
+            raise ValueError(msg)
+        return out.numpy()
+
+    @staticmethod
+    def _apply_functions(functions: list[Callable], image: np.ndarray) -> np.ndarray | torch.Tensor:
+        for function in functions:
+            image = function(image)
+        return image
+
+
+class DeferredNormalize(nn.Module):
+    """Normalize batches of ``uint8`` images on the device they live on.
+
+    Counterpart of ``get_transforms(..., defer_normalize=True)``, which leaves images as ``uint8`` tensors so that
+    dataloader workers neither convert nor normalize them, and a quarter of the bytes are collated and copied to the
+    accelerator. Applying this module to the collated batch after it has been moved to the accelerator performs the
+    normalization, or the rescaling to ``[0, 1]`` for ``InputNormalizationMethod.NONE``, on the whole batch at once.
+
+    Args:
+        mean (tuple[float, ...]): Mean values for each channel.
+        std (tuple[float, ...]): Standard deviation values for each channel.
+        max_pixel_value (float, optional): Maximum possible pixel value.
+            Defaults to ``255.0``.
+
+    Examples:
+        >>> normalize = DeferredNormalize.from_normalization_method(InputNormalizationMethod.IMAGENET)
+        >>> images = torch.randint(0, 256, (32, 3, 256, 256), dtype=torch.uint8)
+        >>> normalize(images).dtype
+        torch.float32
+    """
+
+    def __init__(self, mean: tuple[float, ...], std: tuple[float, ...], max_pixel_value: float = 255.0) -> None:
+        super().__init__()
+        self.max_pixel_value = max_pixel_value
+        self.mean: torch.Tensor
+        self.inv_std: torch.Tensor
+        self.register_buffer("mean", torch.tensor(mean).view(-1, 1, 1) * max_pixel_value, persistent=False)
+        self.register_buffer("inv_std", 1 / (torch.tensor(std).view(-1, 1, 1) * max_pixel_value), persistent=False)
+        self._stats = (tuple(mean), tuple(std))
+
+    @classmethod
+    def from_normalization_method(
+        cls: type["DeferredNormalize"],
+        normalization: InputNormalizationMethod,
+    ) -> "DeferredNormalize":
+        """Create the module applying the given normalization method.
+
+        Args:
+            normalization (InputNormalizationMethod): Normalization method passed to ``get_transforms``.
+
+        Raises:
+            ValueError: When the normalization method cannot be deferred.
+
+        Returns:
+            DeferredNormalize: Module normalizing the ``uint8`` images.
+        """
+        if normalization == InputNormalizationMethod.NONE:
+            # same rescaling as ``A.ToFloat(max_value=255)``, for any number of channels
+            return cls(mean=(0.0,), std=(1.0,))
+        if normalization not in _NORMALIZATION_STATS:
+            msg = f"Normalization method {normalization} cannot be deferred."
+            raise ValueError(msg)
+        mean, std = _NORMALIZATION_STATS[normalization]
+        return cls(mean=mean, std=std)
+
+    def to_albumentations(self) -> A.Normalize:
+        """Return the ``A.Normalize`` transform applying the same normalization to a single ``HWC`` image.
+
+        Used to restore the deferred normalization in the transforms that are exported along with a model, as the
+        inferencers only apply those transforms.
+
+        Returns:
+            A.Normalize: Transform normalizing the image as this module does.
+        """
+        mean, std = self._stats
+        return A.Normalize(mean=mean, std=std, max_pixel_value=self.max_pixel_value, always_apply=True)
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        """Normalize a ``(C, H, W)`` image or a ``(N, C, H, W)`` batch of images.
+
+        Args:
+            images (torch.Tensor): Images with pixel values in ``[0, max_pixel_value]``.
+
+        Returns:
+            torch.Tensor: Normalized ``float32`` images.
+        """
+        if images.dtype == torch.float32:
+            return (images - self.mean).mul_(self.inv_std)
+        return images.float().sub_(self.mean).mul_(self.inv_std)
+
+
 def get_transforms(
     config: str | A.Compose | None = None,
     image_size: int | tuple[int, int] | None = None,
     center_crop: int | tuple[int, int] | None = None,
     normalization: InputNormalizationMethod = InputNormalizationMethod.IMAGENET,
     to_tensor: bool = True,
+    defer_normalize: bool = False,
+    batched: bool = False,
+    include_depth: bool = False,
 ) -> A.Compose:
     """Get transforms from config or image size.
 
@@ -49,13 +634,29 @@ def get_transforms(
         to_tensor (bool, optional):
             Boolean to convert the final transforms into Torch tensor.
             Defaults to True.
+        defer_normalize (bool, optional):
+            Leave the normalization, or the rescaling to ``[0, 1]`` when ``normalization`` is ``NONE``, out of the
+            default transforms, so that images are returned as ``uint8``. It is then applied to whole batches on the
+            accelerator with ``DeferredNormalize``. Has no effect when ``config`` is given.
+            Defaults to False.
+        batched (bool, optional):
+            Return a ``BatchedCompose``, which can also transform a whole batch of images passed as ``images``.
+            Only supported for the default transforms.
+            Defaults to False.
+        include_depth (bool, optional):
+            Also transform the ``depth_image`` target like the image, for depth datasets. Not used when ``config`` is a
+            yaml file or an ``A.Compose`` object.
+            Defaults to False.
 
     Raises:
         ValueError: When both ``config`` and ``image_size`` is ``None``.
+        ValueError: When ``batched`` is requested together with ``config``.
+        ValueError: When ``normalization`` is not a known normalization method.
         ValueError: When ``config`` is not a ``str`` or `A.Compose`` object.
 
     Returns:
         A.Compose: Albumentation ``Compose`` object containing the image transforms.
+            Repeated calls with the same arguments return the same cached ``Compose`` object.
 
     Examples:
         >>> import skimage
@@ -71,6 +672,21 @@ def get_transforms(
         >>> output["image"].shape
         torch.Size([3, 256, 256])
 
+        Normalization could be deferred to the batches on the accelerator.
+
+        >>> transforms = get_transforms(image_size=256, defer_normalize=True)
+        >>> normalize = DeferredNormalize.from_normalization_method(InputNormalizationMethod.IMAGENET)
+        >>> images = transforms(image=image)["image"]
+        >>> images.dtype, normalize(images[None]).dtype
+        (torch.uint8, torch.float32)
+
+        Batches of images could be transformed at once.
+
+        >>> transforms = get_transforms(image_size=256, batched=True)
+        >>> output = transforms(images=np.stack([image, image]))
+        >>> output["images"].shape
+        torch.Size([2, 3, 256, 256])
+
 
         Transforms could be read from albumentations Compose object.
 
@@ -95,32 +711,27 @@ def get_transforms(
     """
     transforms: A.Compose
 
+    if config is not None and batched:
+        msg = "Batched transforms are only supported for the default transforms."
+        raise ValueError(msg)
+
     if config is not None:
         if isinstance(config, DictConfig):
             logger.info("Loading transforms from config File")
-            transforms_list = []
-
-            if "Resize" not in config and image_size is not None:
-                resize_height, resize_width = get_image_height_and_width(image_size)
-                transforms_list.append(A.Resize(height=resize_height, width=resize_width, always_apply=True))
-                logger.info("Resize %s added!", (resize_height, resize_width))
-
-            for key, value in config.items():
-                if hasattr(A, key):
-                    transform = getattr(A, key)(**value)
-                    logger.info("Transform %s added!", transform)
-                    transforms_list.append(transform)
-                else:
-                    msg = f"Transformation {key} is not part of albumentations"
-                    raise ValueError(msg)
-
-            transforms_list.append(ToTensorV2())
-            transforms = A.Compose(transforms_list, additional_targets={"image": "image", "depth_image": "image"})
+            resize_size = get_image_height_and_width(image_size) if image_size is not None else None
+            transforms = _build_transforms_from_config(
+                OmegaConf.to_yaml(config, resolve=True),
+                resize_size,
+                include_depth=include_depth,
+            )
 
         # load transforms from config file
         elif isinstance(config, str):
             logger.info("Reading transforms from Albumentations config file: %s.", config)
-            transforms = A.load(filepath_or_buffer=config, data_format="yaml")
+            # key the cache on the resolved path, so relative paths do not hit entries loaded from another directory
+            path = Path(config).resolve()
+            stat = path.stat()
+            transforms = _load_transforms_from_file(str(path), stat.st_mtime_ns, stat.st_size)
         elif isinstance(config, A.Compose):
             logger.info("Transforms loaded from Albumentations Compose object")
             transforms = config
@@ -129,43 +740,197 @@ def get_transforms(
             raise TypeError(msg)
     else:
         logger.info("No config file has been provided. Using default transforms.")
-        transforms_list = []
 
-        # add resize transform
+        # validate resize and center crop sizes
         if image_size is None:
             msg = (
                 "Both config and image_size cannot be `None`. "
                 "Provide either config file to de-serialize transforms or image_size to get the default transformations"
             )
             raise ValueError(msg)
-        resize_height, resize_width = get_image_height_and_width(image_size)
+        resize_size = get_image_height_and_width(image_size)
+        crop_size = get_image_height_and_width(center_crop) if center_crop is not None else None
+        if crop_size is not None and (crop_size[0] > resize_size[0] or crop_size[1] > resize_size[1]):
+            msg = f"Crop size may not be larger than image size. Found {image_size} and {center_crop}"
+            raise ValueError(msg)
+        try:
+            normalization = InputNormalizationMethod(normalization)
+        except ValueError as error:
+            msg = f"Unknown normalization method: {normalization}"
+            raise ValueError(msg) from error
+
+        transforms = _build_default_transforms(
+            resize_size,
+            crop_size,
+            normalization,
+            to_tensor=to_tensor,
+            defer_normalize=defer_normalize,
+            batched=batched,
+            include_depth=include_depth,
+        )
+
+    return transforms
+
+
+# The builders below are memoized so that datamodules, dataloader workers and sweeps requesting the same transforms
+# share a single ``A.Compose`` object instead of re-instantiating every operation (and re-parsing yaml) each time.
+@lru_cache(maxsize=32)
+def _build_transforms_from_config(
+    config: str,
+    image_size: tuple[int, int] | None,
+    *,
+    include_depth: bool,
+) -> A.Compose:
+    """Build the transforms described by a serialized ``DictConfig``.
+
+    Args:
+        config (str): Yaml serialization of the ``DictConfig`` mapping albumentations transform names to arguments.
+        image_size (tuple[int, int] | None): Resize applied first when the config does not define one.
+        include_depth (bool): Also transform the ``depth_image`` target like the image.
+
+    Returns:
+        A.Compose: Albumentation ``Compose`` object containing the image transforms.
+    """
+    transforms_config = OmegaConf.create(config)
+    transforms_list = []
+
+    if "Resize" not in transforms_config and image_size is not None:
+        resize_height, resize_width = image_size
         transforms_list.append(A.Resize(height=resize_height, width=resize_width, always_apply=True))
+        logger.info("Resize %s added!", (resize_height, resize_width))
 
-        # add center crop transform
-        if center_crop is not None:
-            crop_height, crop_width = get_image_height_and_width(center_crop)
-            if crop_height > resize_height or crop_width > resize_width:
-                msg = f"Crop size may not be larger than image size. Found {image_size} and {center_crop}"
-                raise ValueError(msg)
-            transforms_list.append(A.CenterCrop(height=crop_height, width=crop_width, always_apply=True))
-
-        # add normalize transform
-        if normalization == InputNormalizationMethod.IMAGENET:
-            transforms_list.append(A.Normalize(mean=(0.485, 0.456, 0.406), std=(0.229, 0.224, 0.225)))
-        elif normalization == InputNormalizationMethod.CLIP:
-            transforms_list.append(
-                A.Normalize(mean=(0.48145466, 0.4578275, 0.40821073), std=(0.26862954, 0.26130258, 0.27577711)),
-            )
-        elif normalization == InputNormalizationMethod.NONE:
-            transforms_list.append(A.ToFloat(max_value=255))
-        else:
-            msg = f"Unknown normalization method: {normalization}"
+    for key, value in transforms_config.items():
+        transform_class = _ALBUMENTATIONS_TRANSFORMS.get(str(key))
+        if transform_class is None:
+            msg = f"Transformation {key!s} is not part of albumentations"
             raise ValueError(msg)
+        transform = transform_class(**value)
+        logger.info("Transform %s added!", transform)
+        transforms_list.append(transform)
 
-        # add tensor conversion
-        if to_tensor:
-            transforms_list.append(ToTensorV2())
+    transforms_list.append(ToTensorV2())
+    return FusedCompose(transforms_list, additional_targets=_additional_targets(include_depth=include_depth))
 
-        transforms = A.Compose(transforms_list, additional_targets={"image": "image", "depth_image": "image"})
 
-    return transforms
+@lru_cache(maxsize=32)
+def _load_transforms_from_file(path: str, mtime_ns: int, size: int) -> A.Compose:  # noqa: ARG001
+    """Deserialize transforms from an Albumentations yaml file.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so that editing the file invalidates the cached entry.
+
+    Args:
+        path (str): Path to the Albumentations yaml file.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        A.Compose: Albumentation ``Compose`` object containing the image transforms.
+    """
+    return A.load(filepath_or_buffer=path, data_format="yaml")
+
+
+def _normalize_transforms(
+    mean: tuple[float, ...],
+    std: tuple[float, ...],
+    to_tensor: bool,
+) -> tuple[A.BasicTransform, ...]:
+    # normalize and convert to tensor in a single pass over the image
+    return (
+        (NormalizeToTensor(mean=mean, std=std),) if to_tensor else (PrecomputedNormalize(mean, std, always_apply=True),)
+    )
+
+
+def _rescale_transforms(to_tensor: bool) -> tuple[A.BasicTransform, ...]:
+    return (A.ToFloat(max_value=255), ToTensorV2()) if to_tensor else (A.ToFloat(max_value=255),)
+
+
+# factories of the normalization and tensor conversion steps of the default transforms, called with ``to_tensor``.
+_NORMALIZATION_FACTORIES: dict[InputNormalizationMethod, Callable[[bool], tuple[A.BasicTransform, ...]]] = {
+    InputNormalizationMethod.NONE: _rescale_transforms,
+    **{method: partial(_normalize_transforms, mean, std) for method, (mean, std) in _NORMALIZATION_STATS.items()},
+}
+
+
+@lru_cache(maxsize=32)
+def _normalization_transforms(
+    normalization: InputNormalizationMethod,
+    *,
+    to_tensor: bool,
+    defer_normalize: bool,
+    include_depth: bool,  # noqa: ARG001
+) -> tuple[A.BasicTransform, ...]:
+    """Return the normalization and tensor conversion steps of the default transforms.
+
+    The transforms hold no per call state, so the instances are shared by every default ``Compose`` using them.
+    ``Compose`` registers its additional targets on the transforms it is given, so ``include_depth`` is only part of
+    the cache key, keeping pipelines with and without the depth target from sharing instances.
+
+    Args:
+        normalization (InputNormalizationMethod): Normalization method for the input images.
+        to_tensor (bool): Boolean to convert the final transforms into Torch tensor.
+        defer_normalize (bool): Leave the normalization to ``DeferredNormalize``, keeping the images ``uint8``.
+        include_depth (bool): Whether the pipeline also transforms the ``depth_image`` target.
+
+    Returns:
+        tuple[A.BasicTransform, ...]: Transforms to append to the resize and center crop.
+    """
+    if defer_normalize:
+        return (ToTensorV2(),) if to_tensor else ()
+    return _NORMALIZATION_FACTORIES[normalization](to_tensor)
+
+
+@lru_cache(maxsize=32)
+def _build_default_transforms(
+    image_size: tuple[int, int],
+    center_crop: tuple[int, int] | None,
+    normalization: InputNormalizationMethod,
+    *,
+    to_tensor: bool,
+    defer_normalize: bool,
+    batched: bool,
+    include_depth: bool,
+) -> A.Compose:
+    """Build the default transforms from image size.
+
+    Args:
+        image_size (tuple[int, int]): Image height and width to resize to.
+        center_crop (tuple[int, int] | None): Center crop height and width.
+        normalization (InputNormalizationMethod): Normalization method for the input images.
+        to_tensor (bool): Boolean to convert the final transforms into Torch tensor.
+        defer_normalize (bool): Leave the normalization to ``DeferredNormalize``, keeping the images ``uint8``.
+        batched (bool): Return a ``BatchedCompose`` instead of a ``FusedCompose``.
+        include_depth (bool): Also transform the ``depth_image`` target like the image.
+
+    Returns:
+        A.Compose: Albumentation ``Compose`` object containing the image transforms.
+    """
+    transforms_list = []
+
+    # add resize and center crop transforms
+    # bilinear interpolation is also used for downscaling: ``cv2.INTER_AREA`` reads every source pixel, which makes it
+    # several times slower for the usual full resolution inputs, except for exact downscaling by a factor of two.
+    # ``Resize`` and ``CenterCrop`` are kept instead of ``ResizeCenterCrop``: ``cv2.resize`` is faster than its
+    # ``warpAffine`` and skips inputs already at the target size, and keeps the inputs of trained models unchanged.
+    resize_height, resize_width = image_size
+    transforms_list.append(A.Resize(height=resize_height, width=resize_width, always_apply=True))
+    if center_crop is not None:
+        crop_height, crop_width = center_crop
+        transforms_list.append(A.CenterCrop(height=crop_height, width=crop_width, always_apply=True))
+
+    # add normalize and tensor conversion transforms
+    transforms_list.extend(
+        _normalization_transforms(
+            normalization,
+            to_tensor=to_tensor,
+            defer_normalize=defer_normalize,
+            include_depth=include_depth,
+        ),
+    )
+
+    compose_type = BatchedCompose if batched else FusedCompose
+    return compose_type(transforms_list, additional_targets=_additional_targets(include_depth=include_depth))
+
+
+def _additional_targets(*, include_depth: bool) -> dict[str, str]:
+    # ``image`` is already a target of every ``Compose``, only the depth image needs to be mapped to it.
+    return {"depth_image": "image"} if include_depth else {}
@@ -372,7 +372,7 @@ def _get_transform_dict(
     elif isinstance(transform_container, AnomalibDataset):
         transform = transform_container.transform.to_dict()
     elif isinstance(transform_container, AnomalibDataModule):
-        transform = transform_container.test_data.transform.to_dict()
+        transform = transform_container.export_transform.to_dict()
     else:
         logging.error(f"Unsupported type for transform_container: {type(transform_container)}")
         raise TypeError
@@ -740,7 +740,7 @@ class Engine:
 
         if transform is None:
             if datamodule:
-                transform = datamodule.test_data.transform
+                transform = datamodule.export_transform
             elif dataset:
                 transform = dataset.transform
             else:
@@ -4,42 +4,77 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import importlib
 import logging
+from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from omegaconf import OmegaConf
 from omegaconf.dictconfig import DictConfig
 from omegaconf.listconfig import ListConfig
 from rich.logging import RichHandler
 
+if TYPE_CHECKING:
+    from lightning.pytorch.loggers import Logger
+
 __all__ = [
+    "AnomalibCometLogger",
+    "AnomalibTensorBoardLogger",
+    "AnomalibWandbLogger",
     "configure_logger",
     "get_experiment_logger",
 ]
 
-try:
-    from lightning.pytorch.loggers import CSVLogger, Logger
+# The logger backends pull in their experiment tracking clients, so they are only imported on first access.
+_LAZY_IMPORTS = {
+    "AnomalibCometLogger": ".comet",
+    "AnomalibTensorBoardLogger": ".tensorboard",
+    "AnomalibWandbLogger": ".wandb",
+}
 
-    from .comet import AnomalibCometLogger
-    from .tensorboard import AnomalibTensorBoardLogger
-    from .wandb import AnomalibWandbLogger
 
-    __all__.extend(
-        [
-            "AnomalibCometLogger",
-            "AnomalibTensorBoardLogger",
-            "AnomalibWandbLogger",
-        ],
-    )
-except ImportError:
-    print("To use any logger install it using `anomalib install -v`")
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the logger backends on first access."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 AVAILABLE_LOGGERS = ["tensorboard", "wandb", "csv", "comet"]
 
+# modules providing each logger backend, any of which is enough, and the package to install when none is found.
+_LOGGER_REQUIREMENTS: dict[str, tuple[tuple[str, ...], str]] = {
+    "comet": (("comet_ml",), "comet-ml"),
+    "tensorboard": (("tensorboard", "tensorboardX"), "tensorboard"),
+    "wandb": (("wandb",), "wandb"),
+}
+# whether each logger backend is installed, checked per backend without importing any of them.
+_AVAILABLE: dict[str, bool] = {
+    name: any(find_spec(module) is not None for module in modules)
+    for name, (modules, _) in _LOGGER_REQUIREMENTS.items()
+}
+
 
 logger = logging.getLogger(__name__)
 
 
+# log directories already created by this process
+_ENSURED_LOG_DIRS: set[Path] = set()
+
+
+def _ensure_log_dir(log_dir: Path) -> None:
+    # ``absolute`` instead of ``resolve``, as it only joins the working directory without touching the disk
+    log_dir = log_dir.absolute()
+    # a single ``stat`` confirms a known directory was not removed since, e.g. by a sweep cleaning ``project.path``,
+    # instead of the ``mkdir`` attempts of every parent
+    if log_dir in _ENSURED_LOG_DIRS and log_dir.is_dir():
+        return
+    log_dir.mkdir(parents=True, exist_ok=True)
+    _ENSURED_LOG_DIRS.add(log_dir)
+
+
 class UnknownLoggerError(Exception):
     """Raised when the logger option in `config.yaml` file is set incorrectly."""
 
@@ -76,6 +111,7 @@ def get_experiment_logger(
         config (DictConfig): config.yaml file for the corresponding anomalib model.
 
     Raises:
+        ImportError: when the package of a requested logger is not installed
         ValueError: for any logger types apart from false and tensorboard
 
     Returns:
@@ -86,56 +122,77 @@ def get_experiment_logger(
     if "logger" not in config.trainer or config.trainer.logger in (None, False):
         return False
 
+    # Resolve the config once into plain containers instead of going through omegaconf on every lookup.
+    container: dict[str, Any] = OmegaConf.to_container(config, resolve=True)  # type: ignore[assignment]
+    experiment_loggers = container["trainer"]["logger"]
+    if isinstance(experiment_loggers, str):
+        experiment_loggers = [experiment_loggers]
+    log_dir = Path(container["project"]["path"]) / "logs"
+
     logger_list: list[Logger] = []
-    if isinstance(config.trainer.logger, str):
-        config.trainer.logger = [config.trainer.logger]
+    for experiment_logger in experiment_loggers:
+        if not _AVAILABLE.get(experiment_logger, True):
+            msg = (
+                f"To use the {experiment_logger} logger install it using "
+                f"`pip install {_LOGGER_REQUIREMENTS[experiment_logger][1]}`"
+            )
+            raise ImportError(msg)
 
-    for experiment_logger in config.trainer.logger:
         if experiment_logger == "tensorboard":
+            from .tensorboard import AnomalibTensorBoardLogger
+
             logger_list.append(
                 AnomalibTensorBoardLogger(
                     name="Tensorboard Logs",
-                    save_dir=str(Path(config.project.path) / "logs"),
+                    save_dir=str(log_dir),
                     # TODO(ashwinvaidya17): Find location for log_graph key
                     # CVS-122658
                     log_graph=False,
                 ),
             )
         elif experiment_logger == "wandb":
-            wandb_logdir = str(Path(config.project.path) / "logs")
-            Path(wandb_logdir).mkdir(parents=True, exist_ok=True)
+            from .wandb import AnomalibWandbLogger
+
+            wandb_logdir = str(log_dir)
+            _ensure_log_dir(log_dir)
+            data, model = container["data"], container["model"]
+            model_name = model["class_path"].split(".")[-1]
             name = (
-                config.model.class_path.split(".")[-1]
-                if "category" not in config.data.init_args
-                else f"{config.data.init_args.category} {config.model.class_path.split('.')[-1]}"
+                model_name if "category" not in data["init_args"] else f"{data['init_args']['category']} {model_name}"
             )
             logger_list.append(
                 AnomalibWandbLogger(
-                    project=config.data.class_path.split(".")[-1],
+                    project=data["class_path"].split(".")[-1],
                     name=name,
                     save_dir=wandb_logdir,
                 ),
             )
         elif experiment_logger == "comet":
-            comet_logdir = str(Path(config.project.path) / "logs")
-            Path(comet_logdir).mkdir(parents=True, exist_ok=True)
+            from .comet import AnomalibCometLogger
+
+            comet_logdir = str(log_dir)
+            _ensure_log_dir(log_dir)
+            data, model = container["data"], container["model"]
+            model_name = model["class_path"].split(".")[-1]
             run_name = (
-                config.model.name
-                if "category" not in config.data.init_args
-                else f"{config.data.init_args.category} {config.model.class_path.split('.')[-1]}"
+                model["name"]
+                if "category" not in data["init_args"]
+                else f"{data['init_args']['category']} {model_name}"
             )
             logger_list.append(
                 AnomalibCometLogger(
-                    project_name=config.data.class_path.split(".")[-1],
+                    project_name=data["class_path"].split(".")[-1],
                     experiment_name=run_name,
                     save_dir=comet_logdir,
                 ),
             )
         elif experiment_logger == "csv":
-            logger_list.append(CSVLogger(save_dir=Path(config.project.path) / "logs"))
+            from lightning.pytorch.loggers import CSVLogger
+
+            logger_list.append(CSVLogger(save_dir=log_dir))
         else:
             msg = (
-                f"Unknown logger type: {config.trainer.logger}. Available loggers are: {AVAILABLE_LOGGERS}.\n"
+                f"Unknown logger type: {experiment_loggers}. Available loggers are: {AVAILABLE_LOGGERS}.\n"
                 "To enable the logger, set `project.logger` to `true` or use one of available loggers in "
                 "config.yaml\nTo disable the logger, set `project.logger` to `false`."
             )
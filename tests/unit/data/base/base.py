@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+import torch
 from torch.utils.data import DataLoader
 
 from anomalib.data import AnomalibDataModule
@@ -23,3 +24,20 @@ class _TestAnomalibDataModule:
         dataloader = f"{subset}_dataloader"
         assert hasattr(datamodule, dataloader)
         assert isinstance(getattr(datamodule, dataloader)(), DataLoader)
+
+    def test_deferred_normalize_is_applied_after_batch_transfer(self, datamodule: AnomalibDataModule) -> None:
+        """Test that the deferred normalization is applied to uint8 batches once they are on the device."""
+        images = torch.randint(0, 256, (2, 3, 8, 8), dtype=torch.uint8)
+        assert datamodule.on_after_batch_transfer({"image": images}, 0)["image"] is images
+
+        datamodule.configure_deferred_normalize("imagenet", defer_normalize=True)
+        batch = datamodule.on_after_batch_transfer({"image": images}, 0)
+        assert batch["image"].dtype == torch.float32
+        assert torch.allclose(batch["image"], datamodule.deferred_normalize(images))
+
+    def test_dataloaders_pin_memory(self, datamodule: AnomalibDataModule) -> None:
+        """Test that the dataloaders collate into pinned memory when requested."""
+        assert not datamodule.test_dataloader().pin_memory
+        datamodule.pin_memory = True
+        assert datamodule.test_dataloader().pin_memory
+        datamodule.pin_memory = False
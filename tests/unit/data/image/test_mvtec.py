@@ -5,7 +5,11 @@
 
 from pathlib import Path
 
+import albumentations as A  # noqa: N812
+import numpy as np
 import pytest
+import torch
+from albumentations.pytorch import ToTensorV2
 
 from anomalib import TaskType
 from anomalib.data import MVTec
@@ -30,3 +34,30 @@ class TestMVTec(_TestAnomalibImageDatamodule):
         _datamodule.setup()
 
         return _datamodule
+
+
+def test_deferred_normalize_is_exported(tmp_path: Path) -> None:
+    """Test that the transforms exported with a model restore the normalization deferred to the batches."""
+    image = np.random.default_rng(0).integers(0, 256, (300, 300, 3), dtype=np.uint8)
+    default = MVTec(root=tmp_path, category="dummy", image_size=256)
+    deferred = MVTec(root=tmp_path, category="dummy", image_size=256, defer_normalize=True)
+
+    assert deferred.deferred_normalize is not None
+    assert deferred.test_data.transform(image=image)["image"].dtype == torch.uint8
+
+    expected = default.test_data.transform(image=image)["image"]
+    exported = A.from_dict(deferred.export_transform.to_dict())
+    assert torch.allclose(exported(image=image)["image"], expected, atol=1e-5)
+    assert default.export_transform is default.test_data.transform
+
+
+def test_deferred_normalize_rejects_transform_configs(tmp_path: Path) -> None:
+    """Test that the normalization cannot be deferred when custom transforms are used."""
+    with pytest.raises(ValueError, match="default transforms"):
+        MVTec(
+            root=tmp_path,
+            category="dummy",
+            image_size=256,
+            defer_normalize=True,
+            transform_config_eval=A.Compose([A.Resize(256, 256), ToTensorV2()]),
+        )
@@ -7,15 +7,29 @@ This test contains the following test:
         deserializes the transformations.
 """
 
+import json
 import tempfile
+from pathlib import Path
 
 import albumentations as A  # noqa: N812
 import numpy as np
 import pytest
 import skimage
 import torch
+from albumentations.pytorch import ToTensorV2
+from omegaconf import OmegaConf
 
-from anomalib.data.utils import get_transforms
+from anomalib.data.utils import (
+    BatchedCompose,
+    DeferredNormalize,
+    FusedCompose,
+    InputNormalizationMethod,
+    NormalizeToTensor,
+    PrecomputedNormalize,
+    ResizeCenterCrop,
+    fused,
+    get_transforms,
+)
 
 
 def test_transforms_and_image_size_cannot_be_none() -> None:
@@ -99,6 +113,17 @@ def test_load_transforms_from_string() -> None:
         get_transforms(config=0)
 
 
+def test_load_transforms_from_dict_config() -> None:
+    """Ensure transforms are looked up by name in albumentations, and unknown names are reported."""
+    transforms = get_transforms(config=OmegaConf.create({"CenterCrop": {"height": 64, "width": 64}}), image_size=128)
+    assert [type(transform) for transform in transforms.transforms] == [A.Resize, A.CenterCrop, ToTensorV2]
+
+    # ``load`` is a function of albumentations, not a transform
+    for name in ("NotATransform", "load"):
+        with pytest.raises(ValueError, match="is not part of albumentations"):
+            get_transforms(config=OmegaConf.create({name: {}}))
+
+
 def test_to_tensor_returns_correct_type() -> None:
     """Ensure correct type.
 
@@ -114,3 +139,248 @@ def test_to_tensor_returns_correct_type() -> None:
     pre_processor = get_transforms(config=None, image_size=256, to_tensor=False)
     transformed = pre_processor(image=image)["image"]
     assert isinstance(transformed, np.ndarray)
+
+
+def test_unknown_normalization_method() -> None:
+    """Ensure unknown normalization methods are reported as such."""
+    with pytest.raises(ValueError, match="Unknown normalization method"):
+        get_transforms(image_size=256, normalization="unknown")
+
+
+def test_transforms_are_cached() -> None:
+    """Ensure repeated calls with the same arguments return the same ``Compose`` object."""
+    transforms = get_transforms(image_size=256, center_crop=224)
+    assert get_transforms(image_size=(256, 256), center_crop=(224, 224)) is transforms
+    assert get_transforms(image_size=256, center_crop=224, to_tensor=False) is not transforms
+
+
+def test_normalization_transforms_are_shared() -> None:
+    """Ensure the default transforms of different sizes share their normalization transforms."""
+    for normalization in InputNormalizationMethod:
+        transforms = get_transforms(image_size=256, normalization=normalization)
+        assert get_transforms(image_size=128, normalization=normalization).transforms[-1] is transforms.transforms[-1]
+
+    # ``Compose`` registers its targets on the transforms, so depth pipelines get their own instances
+    assert (
+        get_transforms(image_size=256, include_depth=True).transforms[-1]
+        is not get_transforms(image_size=256).transforms[-1]
+    )
+
+
+def test_cached_transforms_from_string_are_invalidated() -> None:
+    """Ensure editing the yaml file invalidates the cached transforms."""
+    config_path = tempfile.NamedTemporaryFile(suffix=".yaml").name
+
+    A.save(transform=A.Compose([A.Resize(256, 256)]), filepath_or_buffer=config_path, data_format="yaml")
+    transform = get_transforms(config=config_path)
+    assert get_transforms(config=config_path) is transform
+
+    A.save(transform=A.Compose([A.Resize(128, 128), A.ToGray()]), filepath_or_buffer=config_path, data_format="yaml")
+    transform = get_transforms(config=config_path)
+    assert len(transform.transforms) == 2
+
+
+def test_cached_transforms_from_string_are_keyed_on_the_resolved_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure relative paths share the cache entry of the file they point to, and only that file."""
+    for directory, size in (("first", 256), ("second", 128)):
+        (tmp_path / directory).mkdir()
+        transforms = A.Compose([A.Resize(size, size)])
+        A.save(
+            transform=transforms,
+            filepath_or_buffer=str(tmp_path / directory / "transforms.yaml"),
+            data_format="yaml",
+        )
+
+    monkeypatch.chdir(tmp_path / "first")
+    transform = get_transforms(config="transforms.yaml")
+    assert get_transforms(config=str(tmp_path / "first" / "transforms.yaml")) is transform
+
+    monkeypatch.chdir(tmp_path / "second")
+    assert get_transforms(config="transforms.yaml").transforms[0].height == 128
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_normalize_to_tensor_matches_normalize(use_numba: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure the fused normalization gives the same result as ``A.Normalize`` followed by ``ToTensorV2``."""
+    if not use_numba:
+        # exercise the OpenCV and NumPy implementation used when numba is not installed.
+        monkeypatch.setattr(fused, "_normalize_to_chw_kernel", None)
+        monkeypatch.setattr(fused, "_lut_to_chw_kernel", None)
+    image = skimage.data.astronaut()
+    mean, std = (0.485, 0.456, 0.406), (0.229, 0.224, 0.225)
+
+    # uint8 images go through the lookup table, float images through the arithmetic kernel.
+    for input_image in (image, image.astype(np.float32)):
+        expected = A.Compose([A.Normalize(mean=mean, std=std), ToTensorV2()])(image=input_image)["image"]
+        transformed = A.Compose([NormalizeToTensor(mean=mean, std=std)])(image=input_image)["image"]
+        assert transformed.is_contiguous()
+        assert torch.allclose(transformed, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("channels", [1, 3, 5])
+def test_precomputed_normalize_matches_normalize(channels: int) -> None:
+    """Ensure ``PrecomputedNormalize`` gives the same result as ``A.Normalize``."""
+    image = np.random.default_rng(0).integers(0, 256, (32, 48, channels), dtype=np.uint8)
+    mean, std = tuple(np.linspace(0.4, 0.5, channels)), tuple(np.linspace(0.2, 0.3, channels))
+
+    # uint8 images go through the lookup table, float images through the arithmetic, other layouts fall back.
+    input_images = [image, image.astype(np.float32), image.astype(np.float64)]
+    input_images += [image[..., 0]] if channels == 1 else []
+    for input_image in input_images:
+        expected = A.Normalize(mean=mean, std=std)(image=input_image)["image"]
+        transformed = PrecomputedNormalize(mean=mean, std=std)(image=input_image)["image"]
+        assert transformed.dtype == expected.dtype
+        assert transformed.shape == expected.shape
+        assert np.allclose(transformed, expected, atol=1e-5)
+
+
+def test_kernels_are_compiled_with_the_transforms() -> None:
+    """Ensure creating ``NormalizeToTensor`` compiles the Numba kernels, so that forked workers inherit them."""
+    pytest.importorskip("numba")
+    fused.compile_kernels.cache_clear()
+    NormalizeToTensor(mean=(0.5, 0.5, 0.5), std=(0.5, 0.5, 0.5))
+    assert fused._lut_to_chw_kernel.signatures  # noqa: SLF001
+    assert len(fused._normalize_to_chw_kernel.signatures) >= 2  # noqa: SLF001
+
+
+def test_deferred_normalize_matches_default_transforms() -> None:
+    """Ensure deferring the normalization to ``DeferredNormalize`` gives the same images."""
+    image = skimage.data.astronaut()
+    normalize = DeferredNormalize.from_normalization_method(InputNormalizationMethod.IMAGENET)
+
+    expected = get_transforms(image_size=256)(image=image)["image"]
+    deferred = get_transforms(image_size=256, defer_normalize=True)(image=image)["image"]
+    assert deferred.dtype == torch.uint8
+    assert torch.allclose(normalize(deferred[None])[0], expected, atol=1e-5)
+
+    # without normalization, the images are only rescaled to [0, 1]
+    normalize = DeferredNormalize.from_normalization_method(InputNormalizationMethod.NONE)
+    expected = get_transforms(image_size=256, normalization=InputNormalizationMethod.NONE)(image=image)["image"]
+    deferred = get_transforms(image_size=256, normalization=InputNormalizationMethod.NONE, defer_normalize=True)(
+        image=image,
+    )["image"]
+    assert deferred.dtype == torch.uint8
+    assert torch.allclose(normalize(deferred[None])[0], expected, atol=1e-6)
+
+
+def test_fused_compose_matches_compose() -> None:
+    """Ensure ``FusedCompose`` gives the same results as ``A.Compose``."""
+    image = skimage.data.astronaut()
+    mask = np.zeros(image.shape[:2])
+    mask[100:200, 100:200] = 1.0
+
+    transforms = get_transforms(image_size=256, center_crop=224)
+    assert isinstance(transforms, FusedCompose)
+
+    expected = A.Compose(transforms.transforms)(image=image, mask=mask)
+    transformed = transforms(image=image, mask=mask)
+    assert torch.allclose(transformed["image"], expected["image"])
+    assert torch.equal(transformed["mask"], expected["mask"])
+
+    # the default center crop keeps the pixel values of ``A.Resize`` followed by ``A.CenterCrop``
+    assert [type(transform) for transform in transforms.transforms] == [A.Resize, A.CenterCrop, NormalizeToTensor]
+
+
+@pytest.mark.parametrize("center_crop", [None, 224])
+@pytest.mark.parametrize("to_tensor", [True, False])
+@pytest.mark.parametrize("batched", [True, False])
+def test_default_transforms_are_exported_as_albumentations(
+    center_crop: int | None,
+    to_tensor: bool,
+    batched: bool,
+) -> None:
+    """Ensure the default transforms serialize to stock albumentations transforms giving the same results."""
+    image = skimage.data.astronaut()
+    transforms = get_transforms(image_size=256, center_crop=center_crop, to_tensor=to_tensor, batched=batched)
+
+    serialized = transforms.to_dict()
+    assert "anomalib" not in json.dumps(serialized)
+
+    expected = transforms(image=image)["image"]
+    transformed = A.from_dict(serialized)(image=image)["image"]
+    assert type(transformed) is type(expected)
+    assert np.allclose(np.asarray(transformed), np.asarray(expected), atol=1e-5)
+
+
+def test_depth_image_is_only_transformed_when_included() -> None:
+    """Ensure the ``depth_image`` target is only registered for depth pipelines."""
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    depth_image = np.zeros((64, 64, 3), dtype=np.float32)
+
+    transforms = get_transforms(image_size=32, include_depth=True)
+    assert transforms.additional_targets == {"depth_image": "image"}
+    assert transforms(image=image, depth_image=depth_image)["depth_image"].shape == (3, 32, 32)
+
+    assert get_transforms(image_size=32).additional_targets == {}
+
+
+def test_fused_compose_checks_shapes() -> None:
+    """Ensure ``FusedCompose`` rejects images and masks of different sizes like ``A.Compose``."""
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    mask = np.zeros((32, 32))
+
+    with pytest.raises(ValueError, match="Height and Width of image, mask or masks should be equal"):
+        get_transforms(image_size=32)(image=image, mask=mask)
+
+    transformed = FusedCompose(get_transforms(image_size=32).transforms, is_check_shapes=False)(image=image, mask=mask)
+    assert transformed["image"].shape == (3, 32, 32)
+    assert transformed["mask"].shape == (32, 32)
+
+
+def test_batched_transforms_match_per_image_transforms() -> None:
+    """Ensure transforming a batch at once gives the same images as transforming them one by one."""
+    image = skimage.data.astronaut()
+    images = np.stack([image, np.flip(image, axis=0)])
+
+    transforms = get_transforms(image_size=256, center_crop=224, batched=True)
+    assert isinstance(transforms, BatchedCompose)
+
+    batch = transforms(images=images)["images"]
+    expected = torch.stack([transforms(image=image)["image"] for image in images])
+    assert batch.shape == (2, 3, 224, 224)
+    assert torch.allclose(batch, expected)
+
+
+def test_batched_transforms_reject_empty_batch() -> None:
+    """Ensure an empty batch raises a clear error instead of failing while stacking the outputs."""
+    transforms = get_transforms(image_size=32, batched=True)
+    with pytest.raises(ValueError, match="empty batch"):
+        transforms(images=np.zeros((0, 64, 64, 3), dtype=np.uint8))
+    with pytest.raises(ValueError, match="empty batch"):
+        transforms.apply_to_batch([])
+
+
+@pytest.mark.parametrize("image_size", [(512, 512), (256, 384), (100, 120)])
+def test_resize_center_crop_matches_resize_and_center_crop(image_size: tuple[int, int]) -> None:
+    """Ensure ``ResizeCenterCrop`` gives the same result as ``A.Resize`` followed by ``A.CenterCrop``."""
+    image = skimage.data.astronaut()
+    mask = np.zeros(image.shape[:2])
+    mask[100:200, 150:300] = 1.0
+
+    expected = A.Compose([A.Resize(*image_size), A.CenterCrop(96, 64)])(image=image, mask=mask)
+    transformed = A.Compose([ResizeCenterCrop(*image_size, crop_height=96, crop_width=64)])(image=image, mask=mask)
+    assert transformed["image"].shape == expected["image"].shape
+    # warpAffine snaps the sample positions to a 1/32 pixel grid, which resize does not.
+    difference = np.abs(transformed["image"].astype(int) - expected["image"].astype(int))
+    assert difference.max() <= 3
+    assert difference.mean() < 0.25
+    assert np.array_equal(transformed["mask"], expected["mask"])
+
+
+def test_batched_transforms_write_into_preallocated_batch() -> None:
+    """Ensure a batch buffer passed as ``out`` is filled in place and reused across calls."""
+    image = skimage.data.astronaut()
+    transforms = get_transforms(image_size=32, batched=True)
+    out = torch.empty(2, 3, 32, 32)
+
+    batch = transforms.apply_to_batch([image, image], out=out)
+    assert batch is out
+    assert torch.allclose(out[0], transforms(image=image)["image"])
+
+    with pytest.raises(ValueError, match="Expected a contiguous float32 CPU tensor"):
+        transforms.apply_to_batch([image], out=out)
+    with pytest.raises(ValueError, match="only supported for transforms ending with NormalizeToTensor"):
+        get_transforms(image_size=32, to_tensor=False, batched=True).apply_to_batch([image], out=out)
@@ -3,6 +3,8 @@
 # Copyright (C) 2022-2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -100,3 +102,40 @@ def test_get_experiment_logger(tmp_path: Path) -> None:
         config.trainer.logger = "randomlogger"
         with pytest.raises(UnknownLoggerError):
             logger = get_experiment_logger(config=config)
+
+
+def test_logger_backends_are_imported_lazily() -> None:
+    """Test that importing ``anomalib.loggers`` does not import the logger backends."""
+    backends = ("anomalib.loggers.comet", "anomalib.loggers.tensorboard", "anomalib.loggers.wandb")
+    code = f"import sys, anomalib.loggers; assert not set({backends}) & set(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_missing_logger_backend_is_reported(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only the loggers whose backend is missing are unavailable, and the missing package is named."""
+    import anomalib.loggers
+
+    monkeypatch.setitem(anomalib.loggers._AVAILABLE, "wandb", value=False)  # noqa: SLF001
+    config = OmegaConf.create({"project": {"path": tmp_path}, "trainer": {"logger": "csv"}})
+    assert isinstance(get_experiment_logger(config=config)[0], CSVLogger)
+
+    config.trainer.logger = ["csv", "wandb"]
+    with pytest.raises(ImportError, match="pip install wandb"):
+        get_experiment_logger(config=config)
+
+
+def test_log_dir_is_created_once_and_recreated_when_removed(tmp_path: Path) -> None:
+    """Test that known log directories are not created again, unless they were removed since."""
+    import anomalib.loggers
+
+    log_dir = tmp_path / "project" / "logs"
+    anomalib.loggers._ensure_log_dir(log_dir)  # noqa: SLF001
+    assert log_dir.is_dir()
+
+    with patch.object(Path, "mkdir") as mkdir:
+        anomalib.loggers._ensure_log_dir(log_dir)  # noqa: SLF001
+    mkdir.assert_not_called()
+
+    log_dir.rmdir()
+    anomalib.loggers._ensure_log_dir(log_dir)  # noqa: SLF001
+    assert log_dir.is_dir()